@@ -1,5 +1,9 @@
 import pandas as pd
-from typing import Dict, Any, List, Callable
+import numpy as np
+from typing import Dict, Any, List, Callable, Iterator, Tuple
+from functools import partial
+
+from src.eda_kernels import bin_rate
 
 BORROWER_COLS = [
     "id", "member_id",
@@ -13,13 +17,108 @@ BORROWER_COLS = [
     "url",
 ]
 
+INCOME_COLS = ["annual_inc", "annual_inc_joint"]
+
+INCOME_STATS = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+
+FREQ_COLS = ["home_ownership", "addr_state", "purpose"]
+
+DEFAULT_RATE_COLS = ["home_ownership", "purpose"]
+
+CATEGORY_COLS = ["home_ownership", "addr_state", "purpose",
+                 "verification_status"]
+
+BACKENDS = ("pandas", "polars")
+
 class BorrowerProfileEDA:
-    def __init__(self, df: pd.DataFrame, target_col: str = "loan_status"):
+    def __init__(self, df: pd.DataFrame, target_col: str = "loan_status",
+                 backend: str = "pandas"):
         """
-        Store the full DataFrame and the name of the target column.
+        Store the full DataFrame, the name of the target column and the
+        backend used by run_borrower_eda_pipeline ("pandas" or "polars").
+
+        The low-cardinality CATEGORY_COLS are cast to category dtype and an
+        integer target is downcast (int8 for a 0/1 target) on a shallow
+        copy, so the caller's DataFrame is left untouched. The
+        BORROWER_COLS projection and its missing-value mask are built once
+        here and reused by the summary methods. With backend="polars" the
+        needed columns are converted to a polars LazyFrame on the first
+        pipeline run and cached (see _lazy_frame). That conversion costs
+        about as much as one pandas run, so the backend only pays off over
+        repeated runs on the same object, or with from_parquet.
+
+        df can also be a polars LazyFrame (see from_parquet) or DataFrame;
+        every method then runs as a streaming polars query instead.
         """
-        self.df = df
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"backend must be one of {BACKENDS}, got {backend!r}")
         self.target_col = target_col
+        self.backend = backend
+        self._lazy = not isinstance(df, pd.DataFrame)
+        if self._lazy:
+            import polars as pl
+
+            if isinstance(df, pl.DataFrame):
+                df = df.lazy()
+            elif not isinstance(df, pl.LazyFrame):
+                raise TypeError(
+                    "df must be a pandas DataFrame or a polars "
+                    f"DataFrame/LazyFrame, got {type(df).__name__}")
+            if backend != "polars":
+                raise ValueError("a LazyFrame requires backend='polars'")
+            self.df = df
+            self._lf = df
+            # pandas dtypes of the columns, from a zero-row collect.
+            self._dtypes = (df.select(BORROWER_COLS).head(0).collect()
+                            .to_pandas().dtypes.values)
+            return
+
+        casts = {c: df[c].astype("category") for c in CATEGORY_COLS}
+        if pd.api.types.is_integer_dtype(df[target_col]):
+            casts[target_col] = pd.to_numeric(df[target_col],
+                                              downcast="integer")
+        df = df.assign(**casts)
+        self.df = df
+        self._sub = df.loc[:, BORROWER_COLS]
+        self._isna = self._sub.isna()
+        self._dtypes = self._sub.dtypes.values
+        # float32 target shared by the default-rate reductions; None while
+        # the target is not numeric yet (e.g. raw loan_status strings).
+        self._y = (df[target_col].to_numpy(dtype=np.float32)
+                   if pd.api.types.is_numeric_dtype(df[target_col]) else None)
+        self._lf = None
+
+    @classmethod
+    def from_parquet(cls, path: str,
+                     target_col: str = "loan_status") -> "BorrowerProfileEDA":
+        """
+        Build the EDA on pl.scan_parquet(path) instead of a pandas
+        DataFrame, so only the projected columns and the aggregated
+        results ever go through memory. Uses the polars backend.
+        """
+        import polars as pl
+
+        return cls(pl.scan_parquet(path), target_col, backend="polars")
+
+    def _lazy_frame(self):
+        """
+        Return the polars LazyFrame, converting the needed pandas columns
+        with pl.from_pandas on first use and caching the result.
+        """
+        if self._lf is None:
+            import polars as pl
+
+            needed = list(dict.fromkeys(BORROWER_COLS + [self.target_col]))
+            self._lf = pl.from_pandas(self.df[needed]).lazy()
+        return self._lf
+
+    def _collect(self, exprs: List[Any]):
+        """
+        Run one select over the LazyFrame with the streaming engine and
+        return the one-row polars DataFrame.
+        """
+        return self._lf.select(exprs).collect(engine="streaming")
 
     def structure_summary(self) -> pd.DataFrame:
         """
@@ -30,27 +129,20 @@ class BorrowerProfileEDA:
         - missing_pct: percentage of missing values
         - n_unique: number of unique values
         """
-        dataframe_list = []
-        for col in BORROWER_COLS:
-            
-            empty_dict = dict()
-            columns_name = col
-            dtype = self.df[col].dtypes
-            n_missing = self.df[col].isna().sum()
-            missing_pct = self.df[col].isna().mean()
-            n_unique = self.df[col].nunique(dropna=True)
-            
-            empty_dict = dict()
-            list_of_variables = ["column", "dtype", "n_missing", "missing_pct", "n_unique"]
-            list_of_values = [columns_name, dtype, n_missing, missing_pct, n_unique]
-            for var, val in zip(list_of_variables, list_of_values):
-                empty_dict[var] = val
-            dataframe_list.append(empty_dict)
-        
-        return pd.DataFrame(dataframe_list, columns = ["column", "dtype", "n_missing", "missing_pct", "n_unique"])
-            
-            
-            
+        if self._lazy:
+            return _structure_from_frame(self._collect(_structure_exprs()),
+                                         self._dtypes)
+
+        n_missing = self._isna.sum(axis=0)
+        missing_pct = n_missing / len(self._sub)
+        n_unique = self._sub.nunique(dropna=True)
+        dtypes = self._sub.dtypes
+
+        return pd.DataFrame({"column": BORROWER_COLS,
+                             "dtype": dtypes.values,
+                             "n_missing": n_missing.values,
+                             "missing_pct": missing_pct.values,
+                             "n_unique": n_unique.values})
 
     def income_summary(self) -> pd.DataFrame:
         """
@@ -62,7 +154,9 @@ class BorrowerProfileEDA:
         Use df[["annual_inc", "annual_inc_joint"]].describe().T
         or equivalent.
         """
-        return self.df[["annual_inc", "annual_inc_joint"]].describe().T
+        if self._lazy:
+            return _income_from_frame(self._collect(_income_exprs()))
+        return self._sub[INCOME_COLS].describe().T
 
     def categorical_freqs(self, max_levels: int = 10) -> Dict[str, pd.Series]:
         """
@@ -77,12 +171,30 @@ class BorrowerProfileEDA:
 
         Each Series should be the result of value_counts().head(max_levels).
         """
-        list_of_dict_variables = ["home_ownership", "addr_state", "purpose"]
-        
+        if max_levels < 0:
+            raise ValueError(
+                f"max_levels must be non-negative, got {max_levels}")
+        if self._lazy:
+            return _freqs_from_frame(self._collect(_freqs_exprs(max_levels)))
+
         info_dict = dict()
-        for var in list_of_dict_variables:
-            info_dict[var] = self.df[var].value_counts().head(max_levels)
-        
+        for var in FREQ_COLS:
+            series = self.df[var]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                # value_counts(sort=False) counts in category order; only
+                # the top levels are then ranked, by first appearance on ties.
+                categories = series.cat.categories
+                counts = series.value_counts(sort=False).to_numpy()
+                top = _top_codes(series.cat.codes.to_numpy(), counts,
+                                 max_levels)
+                info_dict[var] = pd.Series(
+                    counts[top], index=pd.Index(categories[top], name=var),
+                    name="count")
+            else:
+                # nlargest only partially sorts the distinct levels.
+                info_dict[var] = series.value_counts(sort=False).nlargest(
+                    max_levels)
+
         return info_dict
         
         
@@ -94,10 +206,72 @@ class BorrowerProfileEDA:
         Default rate = mean of self.target_col for each category.
         Return a pandas Series indexed by category, with values in [0, 1].
         """
-        return self.df.groupby(col)[self.target_col].mean()
+        if self._lazy:
+            frame = _default_rate_query(self._lf, col, self.target_col)
+            return _default_rate_from_frame(
+                frame.collect(engine="streaming"), col, self.target_col)
+
+        return self._category_rate(col, self._target_values())
+
+    def default_rates_many(self, cols: List[str]) -> Dict[str, pd.Series]:
+        """
+        default_rate_by_category for several columns at once, returned as
+        a dict col -> Series. The target array is looked up once and
+        shared by every column.
+        """
+        if self._lazy:
+            return {col: self.default_rate_by_category(col) for col in cols}
+
+        y = self._target_values()
+        return {col: self._category_rate(col, y) for col in cols}
+
+    def _target_values(self) -> np.ndarray:
+        """
+        The cached float32 target, or a float64 conversion while the
+        target is not numeric yet.
+        """
+        if self._y is not None:
+            return self._y
+        return self.df[self.target_col].to_numpy(dtype="float64")
+
+    def _category_rate(self, col: str, y: np.ndarray) -> pd.Series:
+        """
+        Default rate per category of col against the target array y.
+        """
+        codes, cats = pd.factorize(self.df[col], sort=True)
+        sums, counts = bin_rate(codes, y, len(cats))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rates = sums / counts
+        return pd.Series(rates, index=pd.Index(cats, name=col),
+                         name=self.target_col)
     
     
     
+def _top_codes(codes: np.ndarray, counts: np.ndarray,
+               max_levels: int) -> np.ndarray:
+    """
+    Codes of the max_levels most frequent levels, most frequent first.
+    counts holds the row count per code; codes is -1 for missing rows.
+
+    Equal counts are ordered by first appearance in codes, like
+    value_counts() on the raw labels. Only the candidate levels that
+    share a count need their first position, so that scan is skipped
+    when the counts in the top are all distinct.
+    """
+    observed = np.flatnonzero(counts)
+    n = min(max_levels, len(observed))
+    if n == 0:
+        return observed[:0]
+    cutoff = np.partition(counts[observed], len(observed) - n)[-n]
+    candidates = observed[counts[observed] >= cutoff]
+    cand_counts = counts[candidates]
+    first = np.zeros(len(candidates), dtype=np.intp)
+    values, n_equal = np.unique(cand_counts, return_counts=True)
+    for i in np.flatnonzero(np.isin(cand_counts, values[n_equal > 1])):
+        first[i] = np.argmax(codes == candidates[i])
+    return candidates[np.lexsort((first, -cand_counts))][:n]
+
+
 def borrower_eda_steps(eda: BorrowerProfileEDA) -> Dict[str, Callable[[], Any]]:
     """
     Return a dict mapping step names to zero-argument callables.
@@ -110,10 +284,12 @@ def borrower_eda_steps(eda: BorrowerProfileEDA) -> Dict[str, Callable[[], Any]]:
         - "default_by_home_ownership"
         - "default_by_purpose"
     """
-    return {"structure": eda.structure_summary, "income": eda.income_summary, 
-            "freqs": lambda: eda.categorical_freqs(max_levels = 10),
-            "default_by_home_ownership": lambda: eda.default_rate_by_category("home_ownership"),
-            "default_by_purpose": lambda: eda.default_rate_by_category("purpose")}
+    return {"structure": eda.structure_summary, "income": eda.income_summary,
+            "freqs": partial(eda.categorical_freqs, max_levels=10),
+            "default_by_home_ownership": partial(eda.default_rate_by_category,
+                                                 "home_ownership"),
+            "default_by_purpose": partial(eda.default_rate_by_category,
+                                          "purpose")}
 
 
 def run_borrower_eda_pipeline(eda: BorrowerProfileEDA) -> Dict[str, Any]:
@@ -126,9 +302,182 @@ def run_borrower_eda_pipeline(eda: BorrowerProfileEDA) -> Dict[str, Any]:
     - Collect the outputs in a dict: step_name -> result
 
     This function should clearly show functional programming:
-    we store functions in a dict, then loop and call them.
+    we store functions in a dict, then loop and call them. The loop lives
+    in iter_borrower_eda (which also handles the polars backend); this
+    collects its (step_name, result) pairs.
     """
-    functions_dict = dict()
-    for k,v in borrower_eda_steps(eda).items():
-        functions_dict[k] = v()
-    return functions_dict
\ No newline at end of file
+    return dict(iter_borrower_eda(eda))
+
+
+def iter_borrower_eda(eda: BorrowerProfileEDA) -> Iterator[Tuple[str, Any]]:
+    """
+    Generator version of run_borrower_eda_pipeline: yield
+    (step_name, result) one step at a time.
+
+    Steps run one after the other, so a caller that writes each result
+    out and drops it only ever holds one result in memory. The polars
+    backend computes everything in one query and yields from it.
+    """
+    if eda.backend == "polars":
+        yield from _run_borrower_eda_polars(eda).items()
+        return
+
+    for k, v in borrower_eda_steps(eda).items():
+        yield k, v()
+
+
+def _structure_exprs() -> List[Any]:
+    """
+    Polars expressions for structure_summary: null count and number of
+    unique non-null values per BORROWER_COLS column, plus the row count.
+    """
+    import polars as pl
+
+    exprs = []
+    for c in BORROWER_COLS:
+        exprs.append(pl.col(c).null_count().alias(f"n_missing:{c}"))
+        exprs.append(pl.col(c).drop_nulls().n_unique().alias(f"n_unique:{c}"))
+    exprs.append(pl.len().alias("n_rows"))
+    return exprs
+
+
+def _structure_from_frame(frame, dtypes: List[Any]) -> pd.DataFrame:
+    n_missing = frame.select(
+        [f"n_missing:{c}" for c in BORROWER_COLS]).to_numpy()[0]
+    n_unique = frame.select(
+        [f"n_unique:{c}" for c in BORROWER_COLS]).to_numpy()[0]
+    return pd.DataFrame({
+        "column": BORROWER_COLS,
+        "dtype": dtypes,
+        "n_missing": n_missing,
+        "missing_pct": n_missing / frame["n_rows"].item(),
+        "n_unique": n_unique,
+    })
+
+
+def _income_exprs() -> List[Any]:
+    """
+    Polars expressions for the describe() stats of INCOME_COLS.
+    """
+    import polars as pl
+
+    exprs = []
+    for c in INCOME_COLS:
+        col = pl.col(c)
+        stats = {
+            "count": col.count(),
+            "mean": col.mean(),
+            "std": col.std(),
+            "min": col.min(),
+            "25%": col.quantile(0.25, interpolation="linear"),
+            "50%": col.quantile(0.5, interpolation="linear"),
+            "75%": col.quantile(0.75, interpolation="linear"),
+            "max": col.max(),
+        }
+        exprs.extend(stats[stat].cast(pl.Float64).alias(f"{stat}:{c}")
+                     for stat in INCOME_STATS)
+    return exprs
+
+
+def _income_from_frame(frame) -> pd.DataFrame:
+    return pd.DataFrame(
+        {stat: frame.select([f"{stat}:{c}" for c in INCOME_COLS])
+         .to_numpy()[0]
+         for stat in INCOME_STATS},
+        index=INCOME_COLS,
+    ).astype("float64")
+
+
+def _freqs_exprs(max_levels: int) -> List[Any]:
+    """
+    Polars expressions for categorical_freqs: the top max_levels
+    (level, count) structs of each FREQ_COLS column, as one list.
+
+    unique/unique_counts keep the levels in order of first appearance and
+    the stable sort keeps that order among equal counts, so ties break
+    the same way as value_counts() in the pandas path.
+    """
+    import polars as pl
+
+    exprs = []
+    for c in FREQ_COLS:
+        col = pl.col(c).drop_nulls()
+        exprs.append(
+            pl.struct(col.unique(maintain_order=True),
+                      col.unique_counts().alias("count"))
+            .implode()
+            .list.eval(pl.element()
+                       .sort_by(pl.element().struct.field("count"),
+                                descending=True, maintain_order=True)
+                       .head(max_levels))
+            .alias(f"freqs:{c}"))
+    return exprs
+
+
+def _freqs_from_frame(frame) -> Dict[str, pd.Series]:
+    info_dict = dict()
+    for c in FREQ_COLS:
+        levels = frame[f"freqs:{c}"][0].struct.unnest()
+        info_dict[c] = pd.Series(levels["count"].to_numpy(),
+                                 index=pd.Index(levels[c].to_list(), name=c),
+                                 name="count", dtype="int64")
+    return info_dict
+
+
+def _default_rate_query(lf, col: str, target: str):
+    """
+    Lazy polars query for default_rate_by_category: one row per non-null
+    category of col with the mean target, sorted by category.
+    """
+    import polars as pl
+
+    return (lf.select(col, target).drop_nulls(col)
+            .group_by(col).agg(pl.col(target).cast(pl.Float64).mean())
+            .sort(col))
+
+
+def _default_rate_from_frame(frame, col: str, target: str) -> pd.Series:
+    return pd.Series(frame[target].to_numpy(),
+                     index=pd.Index(frame[col].to_list(), name=col),
+                     name=target, dtype="float64")
+
+
+def _pipeline_expr(max_levels: int = 10) -> List[Any]:
+    """
+    Return the structure, income and frequency steps as a list of polars
+    expressions for a single LazyFrame.select.
+
+    Every expression reduces to one row: scalars for the structure and
+    income stats, imploded lists of structs for the frequency tables.
+    The per-category default rates are group_by queries instead (see
+    _default_rate_query).
+    """
+    return _structure_exprs() + _income_exprs() + _freqs_exprs(max_levels)
+
+
+def _run_borrower_eda_polars(eda: BorrowerProfileEDA,
+                             max_levels: int = 10) -> Dict[str, Any]:
+    """
+    Polars version of run_borrower_eda_pipeline.
+
+    The select from _pipeline_expr and the default-rate group_by queries
+    run on the same LazyFrame (converted from pandas on first use, or
+    scanned from parquet) in one pl.collect_all call. The results are sliced back
+    column-wise into the same pandas shapes the pandas steps return.
+    """
+    import polars as pl
+
+    lf = eda._lazy_frame()
+    queries = [lf.select(_pipeline_expr(max_levels))]
+    queries += [_default_rate_query(lf, c, eda.target_col)
+                for c in DEFAULT_RATE_COLS]
+    frame, *rate_frames = pl.collect_all(queries, engine="streaming")
+
+    report = dict()
+    report["structure"] = _structure_from_frame(frame, eda._dtypes)
+    report["income"] = _income_from_frame(frame)
+    report["freqs"] = _freqs_from_frame(frame)
+    for c, rate_frame in zip(DEFAULT_RATE_COLS, rate_frames):
+        report[f"default_by_{c}"] = _default_rate_from_frame(
+            rate_frame, c, eda.target_col)
+    return report
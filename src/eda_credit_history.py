@@ -1,6 +1,9 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Callable
+from typing import Dict, Any, List, Callable, Iterator, Tuple
+from functools import partial
+
+from src.eda_kernels import bin_rate
 
 CREDIT_NUMERIC_COLS = [
 "dti", "dti_joint",
@@ -18,14 +21,78 @@ CREDIT_NUMERIC_COLS = [
 "collections_12_mths_ex_med",
 ]
 
+BUCKET_COLS = ["dti", "revol_util"]
+
 class CreditHistoryEDA:
     def __init__(self, df: pd.DataFrame, target_col: str = "loan_status"):
         """
         Store the full DataFrame and the name of the target column.
+
+        Float CREDIT_NUMERIC_COLS are downcast to float32 and an integer
+        target is downcast (int8 for a 0/1 target) on a shallow copy, so
+        the caller's DataFrame is left untouched. The
+        CREDIT_NUMERIC_COLS projection and its numeric-dtype mask are
+        built once here and reused by the summary methods.
+
+        df can also be a polars LazyFrame (see from_parquet) or DataFrame;
+        every method then runs as a streaming polars query instead.
         """
-        self.df = df
         self.target_col = target_col
-        
+        self._lazy = not isinstance(df, pd.DataFrame)
+        if self._lazy:
+            import polars as pl
+
+            if isinstance(df, pl.DataFrame):
+                df = df.lazy()
+            elif not isinstance(df, pl.LazyFrame):
+                raise TypeError(
+                    "df must be a pandas DataFrame or a polars "
+                    f"DataFrame/LazyFrame, got {type(df).__name__}")
+            self.df = df
+            # pandas dtypes of the columns, from a zero-row collect.
+            dtypes = (df.select(CREDIT_NUMERIC_COLS).head(0).collect()
+                      .to_pandas().dtypes)
+            self._dtypes = dtypes.values
+            self._numeric_dtypes_mask = dtypes.apply(
+                pd.api.types.is_numeric_dtype)
+            return
+
+        casts = {c: df[c].astype("float32") for c in CREDIT_NUMERIC_COLS
+                 if pd.api.types.is_float_dtype(df[c])}
+        if pd.api.types.is_integer_dtype(df[target_col]):
+            casts[target_col] = pd.to_numeric(df[target_col],
+                                              downcast="integer")
+        df = df.assign(**casts)
+        self.df = df
+        self._sub = df.loc[:, CREDIT_NUMERIC_COLS]
+        self._dtypes = self._sub.dtypes.values
+        # float32 target shared by the default-rate reductions; None while
+        # the target is not numeric yet (e.g. raw loan_status strings).
+        self._y = (df[target_col].to_numpy(dtype=np.float32)
+                   if pd.api.types.is_numeric_dtype(df[target_col]) else None)
+        self._numeric_dtypes_mask = self._sub.dtypes.apply(
+            pd.api.types.is_numeric_dtype)
+
+    @classmethod
+    def from_parquet(cls, path: str,
+                     target_col: str = "loan_status") -> "CreditHistoryEDA":
+        """
+        Build the EDA on pl.scan_parquet(path) instead of a pandas
+        DataFrame, so only the projected columns and the aggregated
+        results ever go through memory.
+        """
+        import polars as pl
+
+        return cls(pl.scan_parquet(path), target_col)
+
+    def _collect_row(self, exprs: List[Any]) -> Dict[str, Any]:
+        """
+        Run one select over the LazyFrame with the streaming engine and
+        return its single row as a dict.
+        """
+        return (self.df.select(exprs)
+                .collect(engine="streaming").row(0, named=True))
+
     def credit_structure_summary(self) -> pd.DataFrame:
         """
         One row per CREDIT_NUMERIC_COLS column with:
@@ -36,28 +103,27 @@ class CreditHistoryEDA:
         - mean (if numeric)
         - std (if numeric)
         """
-        dataframe_list = []
-        for col in CREDIT_NUMERIC_COLS:
-            
-            columns_name = col
-            dtype = self.df[col].dtypes
-            n_missing = self.df[col].isna().sum()
-            missing_pct = self.df[col].isna().mean()
-            if self.df[col].dtype in self.df.select_dtypes(include='number').dtypes.values:
-                mean = self.df[col].mean()
-                std = self.df[col].std()
-            else:
-                mean = np.nan
-                std = np.nan                
-            
-            empty_dict = dict()
-            list_of_variables = ["column", "dtype", "n_missing", "missing_pct", "mean", "std"]
-            list_of_values = [columns_name, dtype, n_missing, missing_pct, mean, std]
-            for var, val in zip(list_of_variables, list_of_values):
-                empty_dict[var] = val
-            dataframe_list.append(empty_dict)
-        
-        return pd.DataFrame(dataframe_list, columns = ["column","dtype","n_missing","missing_pct","mean","std"])
+        if self._lazy:
+            return self._lazy_credit_structure_summary()
+
+        sub = self._sub
+        mask = self._numeric_dtypes_mask
+        stats = sub.loc[:, mask].agg(["count", "mean", "std"]).T
+        stats = stats.reindex(CREDIT_NUMERIC_COLS)
+        # Numeric columns get their missing count from the same agg call;
+        # only non-numeric ones need an isna() pass.
+        isna_counts = len(sub) - stats["count"]
+        if not mask.all():
+            other = sub.loc[:, ~mask].isna().sum()
+            isna_counts = isna_counts.fillna(other)
+        isna_counts = isna_counts.astype("int64")
+
+        return pd.DataFrame({"column": CREDIT_NUMERIC_COLS,
+                             "dtype": sub.dtypes.values,
+                             "n_missing": isna_counts.values,
+                             "missing_pct": isna_counts.values / len(sub),
+                             "mean": stats["mean"].values,
+                             "std": stats["std"].values})
 
     def default_rate_by_bucket(self, col: str, bins: int = 4) -> pd.DataFrame:
         """
@@ -69,10 +135,37 @@ class CreditHistoryEDA:
         - n_loans
         - default_rate
         """
+        return self.default_rate_by_buckets([col], bins=bins)[col]
+
+    def default_rate_by_buckets(self, cols: List[str],
+                                bins: int = 4) -> Dict[str, pd.DataFrame]:
+        """
+        default_rate_by_bucket for several columns at once, returned as a
+        dict col -> DataFrame. The target array cached in __init__ is
+        shared by all columns.
+        """
+        if self._lazy:
+            return {col: self._lazy_default_rate_by_bucket(col, bins)
+                    for col in cols}
+
+        y = self._y
+        if y is None:
+            y = self.df[self.target_col].to_numpy(dtype="float64")
+        return {col: self._bucket_rates(col, bins, y) for col in cols}
+
+    def _bucket_rates(self, col: str, bins: int,
+                      y: np.ndarray) -> pd.DataFrame:
         buckets = pd.qcut(self.df[col], q=bins, duplicates='drop')
-        grouped_buckets = self.df.groupby(buckets)[self.target_col].agg(n_loans ="count",
-                                                            default_rate = "mean")
-        return grouped_buckets.reset_index()
+        intervals = buckets.cat.categories
+        codes = buckets.cat.codes.to_numpy()
+        sums, counts = bin_rate(codes, y, len(intervals))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rates = sums / counts
+        bucket = pd.Categorical.from_codes(np.arange(len(intervals)),
+                                           dtype=buckets.dtype)
+        return pd.DataFrame({col: bucket,
+                             "n_loans": counts,
+                             "default_rate": rates})
 
 
     def correlation_with_default(self) -> pd.Series:
@@ -81,23 +174,130 @@ class CreditHistoryEDA:
         (assuming loan_status is encoded as 0/1).
         Return a Series indexed by column name.
         """
-        list_of_corr = []
-        for col in CREDIT_NUMERIC_COLS:
-            correlation = self.df[col].corr(self.df[self.target_col])
-            list_of_corr.append(correlation)
-        series = pd.Series(data=list_of_corr, index=CREDIT_NUMERIC_COLS)
-        return series    
+        if self._lazy:
+            return self._lazy_correlation_with_default()
+
+        y = self.df[self.target_col].astype("float64")
+        return self._sub.corrwith(y)
+
+    def _lazy_credit_structure_summary(self) -> pd.DataFrame:
+        import polars as pl
+
+        numeric = self._numeric_dtypes_mask
+        exprs = [pl.len().alias("n_rows")]
+        for c in CREDIT_NUMERIC_COLS:
+            exprs.append(pl.col(c).null_count().alias(f"n_missing:{c}"))
+            if numeric[c]:
+                exprs.append(pl.col(c).cast(pl.Float64).mean()
+                             .alias(f"mean:{c}"))
+                exprs.append(pl.col(c).cast(pl.Float64).std()
+                             .alias(f"std:{c}"))
+        row = self._collect_row(exprs)
+
+        n_missing = np.array([row[f"n_missing:{c}"]
+                              for c in CREDIT_NUMERIC_COLS])
+        return pd.DataFrame({
+            "column": CREDIT_NUMERIC_COLS,
+            "dtype": self._dtypes,
+            "n_missing": n_missing,
+            "missing_pct": n_missing / row["n_rows"],
+            "mean": [row.get(f"mean:{c}") for c in CREDIT_NUMERIC_COLS],
+            "std": [row.get(f"std:{c}") for c in CREDIT_NUMERIC_COLS],
+        }).astype({"mean": "float64", "std": "float64"})
+
+    def _lazy_default_rate_by_bucket(self, col: str,
+                                     bins: int) -> pd.DataFrame:
+        import polars as pl
+
+        # Same edges as pd.qcut: linear quantiles of the non-null values,
+        # duplicates dropped; pd.cut on them gives the same intervals.
+        quantiles = np.linspace(0, 1, bins + 1)
+        row = self._collect_row([
+            pl.col(col).quantile(q, interpolation="linear").alias(str(i))
+            for i, q in enumerate(quantiles)])
+        edges = np.unique([row[str(i)] for i in range(len(quantiles))])
+        dtype = pd.cut(pd.Series([], dtype="float64"), bins=edges,
+                       include_lowest=True).dtype
+        k = len(dtype.categories)
+
+        # Right-closed buckets: the code is the number of inner edges
+        # strictly below the value.
+        code = pl.sum_horizontal([(pl.col(col) > e).cast(pl.Int64)
+                                  for e in edges[1:-1]] or [pl.lit(0)])
+        code = pl.when(pl.col(col).is_not_null()).then(code)
+        target = pl.col(self.target_col).cast(pl.Float64)
+        per_bucket = (self.df.select(code.alias("code"), target)
+                      .drop_nulls("code")
+                      .group_by("code")
+                      .agg(pl.col(self.target_col).count().alias("n"),
+                           pl.col(self.target_col).sum().alias("s"))
+                      .collect(engine="streaming"))
+
+        counts = np.zeros(k, dtype=np.int64)
+        sums = np.zeros(k)
+        codes = per_bucket["code"].to_numpy()
+        counts[codes] = per_bucket["n"].to_numpy()
+        sums[codes] = per_bucket["s"].to_numpy()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rates = sums / counts
+        bucket = pd.Categorical.from_codes(np.arange(k), dtype=dtype)
+        return pd.DataFrame({col: bucket,
+                             "n_loans": counts,
+                             "default_rate": rates})
+
+    def _lazy_correlation_with_default(self) -> pd.Series:
+        import polars as pl
+
+        target = pl.col(self.target_col).cast(pl.Float64)
+        exprs = []
+        for c in CREDIT_NUMERIC_COLS:
+            if not self._numeric_dtypes_mask[c]:
+                continue
+            x = pl.col(c).cast(pl.Float64)
+            both = x.is_not_null() & target.is_not_null()
+            exprs.append(pl.corr(x.filter(both), target.filter(both))
+                         .alias(c))
+        row = self._collect_row(exprs)
+        return pd.Series([row.get(c) for c in CREDIT_NUMERIC_COLS],
+                         index=CREDIT_NUMERIC_COLS, dtype="float64")
             
-def credit_history_report(eda: CreditHistoryEDA) -> Dict[str, Any]: 
-    # steps: Dict[str, Callable[[], Any]] =
-    step_name = {
+def credit_history_steps(
+        eda: CreditHistoryEDA) -> Dict[str, Callable[[], Any]]:
+    """
+    Return a dict mapping step names to zero-argument callables.
+    The "buckets" step returns a dict col -> DataFrame for BUCKET_COLS.
+    """
+    return {
     "structure_summary": eda.credit_structure_summary,
-    "dti_buckets": lambda: eda.default_rate_by_bucket("dti", bins=5),
-    "revol_util_buckets": lambda: eda.default_rate_by_bucket("revol_util", bins=5),
+    "buckets": partial(eda.default_rate_by_buckets, BUCKET_COLS, bins=5),
     "correlation_with_default": eda.correlation_with_default,
-    }  
-    credit_history_report = {name: func() for name, func in step_name.items()}
-    return credit_history_report
+    }
+
+
+def _report_items(name: str, result: Any) -> Iterator[Tuple[str, Any]]:
+    """
+    Turn one step result into report entries; the buckets step becomes
+    one "<col>_buckets" entry per column.
+    """
+    if name == "buckets":
+        for col, frame in result.items():
+            yield f"{col}_buckets", frame
+    else:
+        yield name, result
+
+
+def credit_history_report(eda: CreditHistoryEDA) -> Dict[str, Any]:
+    return dict(iter_credit_history(eda))
+
+
+def iter_credit_history(eda: CreditHistoryEDA) -> Iterator[Tuple[str, Any]]:
+    """
+    Generator version of credit_history_report: yield (name, result)
+    with the same names, running one step at a time so a caller that
+    writes each result out and drops it only holds one in memory.
+    """
+    for name, func in credit_history_steps(eda).items():
+        yield from _report_items(name, func())
 
 
 # This is the end
\ No newline at end of file
@@ -0,0 +1,55 @@
+import numpy as np
+from typing import Tuple
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional, fall back to numpy
+    njit = None
+
+
+def _bin_rate_numpy(codes: np.ndarray, y: np.ndarray,
+                    k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    numpy version of bin_rate, used when numba is not installed.
+    """
+    mask = (codes >= 0) & ~np.isnan(y)
+    sums = np.bincount(codes[mask], weights=y[mask], minlength=k)
+    counts = np.bincount(codes[mask], minlength=k)
+    return sums, counts
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _bin_rate_numba(codes, y, k):
+        """
+        Serial numba loop over the rows; not parallel, since concurrent
+        sums[c] += y[i] updates from prange would race.
+        """
+        sums = np.zeros(k)
+        counts = np.zeros(k, np.int64)
+        for i in range(codes.size):
+            c = codes[i]
+            if c >= 0 and not np.isnan(y[i]):
+                sums[c] += y[i]
+                counts[c] += 1
+        return sums, counts
+
+
+def bin_rate(codes: np.ndarray, y: np.ndarray,
+             k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sum of y and number of rows for each bin in one serial pass.
+
+    - codes: integer bin id per row in [0, k), -1 for missing
+    - y: float32/float64 target per row, NaN rows are skipped
+    - k: number of bins
+
+    Return (sums, counts), both of length k.
+    """
+    codes = np.ascontiguousarray(codes, dtype=np.intp)
+    if y.dtype not in (np.float32, np.float64):
+        y = y.astype(np.float64)
+    y = np.ascontiguousarray(y)
+    if njit is None:
+        return _bin_rate_numpy(codes, y, k)
+    return _bin_rate_numba(codes, y, k)